@@ -1,9 +1,59 @@
 # to use: python rename_project.py project_name initialization_command  
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterator, NamedTuple, Pattern
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:
+    tomllib = None
+
+TEXT_EXTENSIONS = {'.txt', '.toml', '.ini', '.yaml', '.yml', '.json'}
+
+# Directories that never hold project sources; dot-directories are always skipped
+SKIP_DIRS = {'node_modules', '__pycache__', 'dist', 'build'}
+
+# Structural pyproject.toml patterns; the names they capture are compared
+# against the old values at substitution time
+_PYPROJECT_NAME_RE = re.compile(r'^(name\s*=\s*["\'])([^"\']+)(["\'])', re.MULTILINE)
+_PYPROJECT_SCRIPT_RE = re.compile(r'(\[project\.scripts\]\s*^)([^\s=]+)', re.MULTILINE)
+
+# Files at least this large are pre-screened through mmap instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+# Serializes progress output from the update worker threads
+_print_lock = threading.Lock()
+
+class Replacements(NamedTuple):
+    """Compiled replacement state shared by every file of a rename."""
+    pattern: Pattern[str]
+    mapping: Dict[str, str]
+    needles: Tuple[bytes, ...]
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every non-hidden regular file below root in a single scandir pass.
+    
+    Dot-directories such as .git or .venv and the build/cache directories in
+    SKIP_DIRS are pruned instead of being walked and filtered afterwards.
+    Directories are visited from an explicit stack rather than by recursion.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith('.') or entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
 
 def get_current_project_info() -> Tuple[str, str]:
     """Get current project name and command from pyproject.toml."""
@@ -14,66 +64,122 @@ def get_current_project_info() -> Tuple[str, str]:
     with open(pyproject, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    if tomllib is not None:
+        project = tomllib.loads(content).get('project', {})
+        current_name = project.get('name')
+        if not current_name:
+            raise ValueError("Could not determine current project name from pyproject.toml")
+        current_command = next(iter(project.get('scripts', {})), current_name)
+        return current_name, current_command
+    
     # Extract current project name
-    name_match = re.search(r'^name\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+    name_match = _PYPROJECT_NAME_RE.search(content)
     if not name_match:
         raise ValueError("Could not determine current project name from pyproject.toml")
-    current_name = name_match.group(1)
+    current_name = name_match.group(2)
     
     # Extract current command
-    command_match = re.search(
-        r'\[project\.scripts\]\s*^([^\s=]+)', 
-        content, 
-        re.MULTILINE | re.DOTALL
-    )
-    current_command = command_match.group(1) if command_match else current_name
+    command_match = _PYPROJECT_SCRIPT_RE.search(content)
+    current_command = command_match.group(2) if command_match else current_name
     
     return current_name, current_command
 
-def update_file_content(
-    content: str, 
-    old_name: str, 
-    new_name: str, 
-    old_command: str, 
+def compile_replacements(
+    old_name: str,
+    new_name: str,
+    old_command: str,
     new_command: str
-) -> str:
-    """Update file content with new project name and command."""
+) -> Replacements:
+    """Compile a single alternation matching every name and command variant.
+    
+    Returns the compiled pattern, the mapping from each matched variant to
+    its replacement, and the encoded variants used to skip files that cannot
+    match, so a file can be rewritten in one pass.
+    """
     # Update project name in various contexts
-    patterns = [
-        (rf'\b{re.escape(old_name)}\b', new_name),  # Whole word matches
-        (rf'\b{re.escape(old_name.capitalize())}\b', new_name.capitalize()),
-        (rf'\b{re.escape(old_name.upper())}\b', new_name.upper()),
-        (rf'\b{re.escape(old_name.replace('_', '-'))}\b', new_name.replace('_', '-')),
+    variants = [
+        (old_name, new_name),  # Whole word matches
+        (old_name.capitalize(), new_name.capitalize()),
+        (old_name.upper(), new_name.upper()),
+        (old_name.replace('_', '-'), new_name.replace('_', '-')),
     ]
     
     # Update command in various contexts
     if old_command != new_command:
-        patterns.extend([
-            (rf'\b{re.escape(old_command)}\b', new_command),
-            (rf'\b{re.escape(old_command.upper())}\b', new_command.upper()),
+        variants.extend([
+            (old_command, new_command),
+            (old_command.upper(), new_command.upper()),
         ])
     
-    # Apply all replacements
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content)
+    # Earlier variants win when two of them spell the same text
+    mapping: Dict[str, str] = {}
+    for old, new in variants:
+        mapping.setdefault(old, new)
+    
+    # Longest keys first so a short variant never shadows a longer one
+    alternation = '|'.join(re.escape(k) for k in sorted(mapping, key=len, reverse=True))
+    return Replacements(
+        pattern=re.compile(rf'\b({alternation})\b'),
+        mapping=mapping,
+        needles=tuple(k.encode('utf-8') for k in mapping),
+    )
+
+def _may_contain(file_path: Path, needles: Tuple[bytes, ...]) -> bool:
+    """Check a large file for any needle without copying it into memory."""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return any(mm.find(needle) >= 0 for needle in needles)
+
+def update_file_content(content: str, replacements: Replacements) -> Tuple[str, int]:
+    """Update file content with new project name and command.
     
-    return content
+    Returns the new content and the number of replacements made.
+    """
+    mapping = replacements.mapping
+    return replacements.pattern.subn(lambda m: mapping[m.group(1)], content)
 
-def update_file(file_path: Path, old_name: str, new_name: str, old_command: str, new_command: str) -> None:
-    """Update content in a file with new project name and command."""
+def update_file(file_path: Path, replacements: Replacements, cwd: str) -> bool:
+    """Update content in a file with new project name and command.
+    
+    Returns True if the file was rewritten.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Most files never mention the old name; skip decoding and regex for them
+        if file_path.stat().st_size >= MMAP_THRESHOLD:
+            if not _may_contain(file_path, replacements.needles):
+                return False
+            data = file_path.read_bytes()
+        else:
+            data = file_path.read_bytes()
+            if not any(needle in data for needle in replacements.needles):
+                return False
         
-        new_content = update_file_content(content, old_name, new_name, old_command, new_command)
+        content = data.decode('utf-8')
+        new_content, count = update_file_content(content, replacements)
         
-        if new_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
+        # The substitution count replaces a full-length string comparison
+        if count:
+            # newline='' keeps the line endings exactly as they were read
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
                 f.write(new_content)
-            print(f"  Updated {file_path.relative_to(Path.cwd())}")
+            return True
             
     except Exception as e:
-        print(f"  Error updating {file_path.relative_to(Path.cwd())}: {e}")
+        with _print_lock:
+            print(f"  Error updating {os.path.relpath(file_path, cwd)}: {e}")
+    
+    return False
+
+def update_files(file_paths: List[Path], replacements: Replacements, cwd: str) -> None:
+    """Update several files concurrently; each file is independent I/O."""
+    if not file_paths:
+        return
+    workers = min(len(file_paths), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        updated = sum(executor.map(lambda path: update_file(path, replacements, cwd), file_paths))
+    print(f"  Updated {updated} of {len(file_paths)} files")
 
 def update_pyproject_toml(file_path: Path, old_name: str, new_name: str, old_command: str, new_command: str) -> None:
     """Update pyproject.toml with new project name and command."""
@@ -82,11 +188,9 @@ def update_pyproject_toml(file_path: Path, old_name: str, new_name: str, old_com
             content = f.read()
         
         # Update project name
-        content = re.sub(
-            rf'^(name\s*=\s*["\']){re.escape(old_name)}(["\'])',
-            f'\\g<1>{new_name}\\g<2>',
-            content,
-            flags=re.MULTILINE
+        content = _PYPROJECT_NAME_RE.sub(
+            lambda m: m.group(1) + new_name + m.group(3) if m.group(2) == old_name else m.group(0),
+            content
         )
         
         # Update package path if it exists
@@ -98,11 +202,9 @@ def update_pyproject_toml(file_path: Path, old_name: str, new_name: str, old_com
         
         # Update command in scripts section if it exists
         if old_command != new_command:
-            content = re.sub(
-                rf'(\[project\.scripts\]\s*^){re.escape(old_command)}\b',
-                f'\\g<1>{new_command}',
-                content,
-                flags=re.MULTILINE
+            content = _PYPROJECT_SCRIPT_RE.sub(
+                lambda m: m.group(1) + new_command if m.group(2) == old_command else m.group(0),
+                content
             )
         
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -117,6 +219,7 @@ def rename_project(new_name: str, new_command: str) -> None:
     """Rename the project and update all references."""
     try:
         current_dir = Path.cwd()
+        cwd = str(current_dir)
         old_name, old_command = get_current_project_info()
         
         print(f"Renaming project from '{old_name}' to '{new_name}'...")
@@ -128,11 +231,14 @@ def rename_project(new_name: str, new_command: str) -> None:
             print("\nUpdating project configuration...")
             update_pyproject_toml(pyproject, old_name, new_name, old_command, new_command)
         
+        replacements = compile_replacements(old_name, new_name, old_command, new_command)
+        
         # Update README.md and other markdown files
         print("\nUpdating documentation...")
         for md_file in current_dir.glob('*.md'):
             print(f"  Processing {md_file.name}")
-            update_file(md_file, old_name, new_name, old_command, new_command)
+            if update_file(md_file, replacements, cwd):
+                print(f"  Updated {md_file.name}")
         
         # Update Python package directory
         src_dir = current_dir / 'src' / old_name
@@ -144,16 +250,22 @@ def rename_project(new_name: str, new_command: str) -> None:
         
         # Update Python files
         print("\nUpdating Python files...")
-        for py_file in new_src_dir.rglob('*.py'):
-            update_file(py_file, old_name, new_name, old_command, new_command)
+        if new_src_dir.is_dir():
+            py_files = [
+                Path(entry.path)
+                for entry in _walk_files(str(new_src_dir))
+                if entry.name.endswith('.py')
+            ]
+            update_files(py_files, replacements, cwd)
         
-        # Update other text files
+        # Update other text files in one walk, dispatching on extension
         print("\nUpdating other text files...")
-        text_extensions = {'.txt', '.toml', '.ini', '.yaml', '.yml', '.json'}
-        for ext in text_extensions:
-            for file_path in current_dir.rglob(f'*{ext}'):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    update_file(file_path, old_name, new_name, old_command, new_command)
+        text_files = [
+            Path(entry.path)
+            for entry in _walk_files(str(current_dir))
+            if os.path.splitext(entry.name)[1] in TEXT_EXTENSIONS
+        ]
+        update_files(text_files, replacements, cwd)
         
         print("\nProject renamed successfully!")
         print("\nNext steps:")
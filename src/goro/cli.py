@@ -7,23 +7,44 @@ from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from goro.commands.status import status_repo, status_all
-from goro.commands.sync import sync_repository, sync_all_repositories
-from goro.commands.edit import edit_repository
+# Command modules are imported inside the commands that use them, so
+# `goro list` or `goro --version` doesn't pay for rich.progress and the rest
 from goro.config import Config, RepoConfig
 
 app = typer.Typer(name="goro", help="GORO - A Git Repository Manager")
 console = Console()
 
 
+def _resolve_repo_name(name: str) -> str:
+    """Return the tracked name for `name`, rejoining it if the shell split it.
+
+    An unquoted name with spaces arrives as several arguments; the words up to
+    the first option are joined back together.
+    """
+    config = Config.load()
+    found = config.find_repo(name)
+    if found is not None:
+        return found
+
+    if len(sys.argv) > 3:
+        name_parts = []
+        for arg in sys.argv[2:]:
+            if arg.startswith('-'):
+                break
+            name_parts.append(arg)
+        if name_parts:
+            return config.find_repo(' '.join(name_parts)) or ' '.join(name_parts)
+    return name
+
+
 def version_callback(value: bool):
     """Print version and exit."""
     if value:
         from goro import __version__
 
-        console.print(f"goro v{__version__}")
+        # Plain print: this eager callback runs before any command
+        print(f"goro v{__version__}")
         raise typer.Exit()
 
 
@@ -62,6 +83,8 @@ def init():
 @app.command("list")
 def list_repos():
     """List all tracked repositories."""
+    from rich.table import Table
+
     config = Config.load()
     if not config.repos:
         console.print("[yellow]No repositories tracked.[/]")
@@ -74,7 +97,7 @@ def list_repos():
 
     for name, repo in config.repos.items():
         plugins = ", ".join(repo.plugins or [])
-        table.add_row(name, str(repo.path), plugins)
+        table.add_row(name, repo.path, plugins)
 
     console.print(table)
 
@@ -86,12 +109,10 @@ def status(name: Optional[str] = typer.Argument(None, help="Name of the reposito
     Args:
         name: Optional repository name. If not provided, shows status of all repositories.
     """
+    from goro.commands.status import status_repo, status_all
+
     if name:
-        # Handle case where name might be split into multiple arguments
-        if name not in Config.load().repos and len(sys.argv) > 3:
-            # Reconstruct the full name from remaining arguments
-            name = " ".join([name] + sys.argv[3:])
-        status_repo(name)
+        status_repo(_resolve_repo_name(name))
     else:
         status_all()
 
@@ -99,6 +120,8 @@ def status(name: Optional[str] = typer.Argument(None, help="Name of the reposito
 @app.command("status-all")
 def status_all_cmd():
     """Show status of all tracked repositories."""
+    from goro.commands.status import status_all
+
     status_all()
 
 
@@ -109,20 +132,27 @@ def sync(name: Optional[str] = typer.Argument(None, help="Name of the repository
     Args:
         name: Optional repository name. If not provided, syncs all repositories.
     """
+    from goro.commands.sync import sync_repository, sync_all_repositories
+
     if name:
-        # Handle case where name might be split into multiple arguments
-        if name not in Config.load().repos and len(sys.argv) > 3:
-            # Reconstruct the full name from remaining arguments
-            name = " ".join([name] + sys.argv[3:])
-        asyncio.run(sync_repository(name))
+        asyncio.run(sync_repository(_resolve_repo_name(name)))
     else:
         asyncio.run(sync_all_repositories())
 
 
 @app.command("sync-all")
-def sync_all():
+def sync_all(
+    threads: bool = typer.Option(
+        False, "--threads", help="Sync on a thread pool instead of the asyncio loop"
+    ),
+):
     """Synchronize all tracked repositories."""
-    asyncio.run(sync_all_repositories())
+    from goro.commands.sync import sync_all_repositories, sync_all_repositories_threaded
+
+    if threads:
+        sync_all_repositories_threaded()
+    else:
+        asyncio.run(sync_all_repositories())
 
 
 @app.command()
@@ -148,18 +178,9 @@ def edit(
         goro edit my-repo --name new-name --path /new/path
         goro edit my-repo  # Interactive mode
     """
-    # Handle case where name might be split into multiple arguments
-    if name not in Config.load().repos and len(sys.argv) > 3:
-        # Find where the name ends and options begin
-        name_parts = []
-        for i, arg in enumerate(sys.argv[2:], 2):
-            if arg.startswith('--'):
-                break
-            name_parts.append(arg)
-        if name_parts:
-            name = ' '.join(name_parts)
-    
-    edit_repository(name=name, new_name=new_name, path=path, force=force)
+    from goro.commands.edit import edit_repository
+
+    edit_repository(name=_resolve_repo_name(name), new_name=new_name, path=path, force=force)
 
 
 @app.command()
@@ -183,10 +204,10 @@ def add(name: str, path: str):
         raise typer.Exit(1)
 
     # Check if the path is already tracked
-    for repo in config.repos.values():
-        if repo.path == repo_path:
-            console.print(f"[yellow]This path is already tracked as '{repo.name}'.[/]")
-            return
+    existing = config.find_repo_by_path(repo_path)
+    if existing is not None:
+        console.print(f"[yellow]This path is already tracked as '{existing}'.[/]")
+        return
 
     # Add the repository
     config.repos[name] = RepoConfig(name=name, path=repo_path)
@@ -202,11 +223,10 @@ def remove(name: str):
         name: Name of the repository to remove
     """
     config = Config.load()
-    if name not in config.repos:
+    if config.repos.pop(name, None) is None:
         console.print(f"[red]Error: No repository named '{name}' found.[/]")
         raise typer.Exit(1)
 
-    del config.repos[name]
     config.save()
     console.print(f"[green]✓ Removed repository '{name}'[/]")
 
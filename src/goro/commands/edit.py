@@ -8,7 +8,7 @@ import typer
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
-from goro.config import Config, RepoConfig
+from goro.config import Config
 
 console = Console()
 
@@ -29,21 +29,19 @@ def edit_repository(
     config = Config.load()
     
     # Case-insensitive search for the repository
-    repo_name = next((n for n in config.repos if n.lower() == name.lower()), None)
+    repo_name = config.find_repo(name)
     
     if not repo_name:
         console.print(f"[red]Error: Repository '{name}' not found.[/]")
-        console.print("Available repositories:")
-        for repo in config.repos:
-            console.print(f"- {repo}")
+        lines = ["Available repositories:"] + [f"- {repo}" for repo in config.repos]
+        console.print("\n".join(lines))
         raise typer.Exit(1)
     
     repo = config.repos[repo_name]
     
     # If no arguments provided, enter interactive mode
     if new_name is None and path is None:
-        console.print(f"\nEditing repository: [bold]{repo_name}[/]")
-        console.print(f"Current path: {repo.path}")
+        console.print(f"\nEditing repository: [bold]{repo_name}[/]\nCurrent path: {repo.path}")
         
         new_name = Prompt.ask(
             "New name (press Enter to keep current)",
@@ -51,34 +49,31 @@ def edit_repository(
             show_default=False
         )
         
-        new_path = Prompt.ask(
-            "New path (press Enter to keep current)",
-            default=str(repo.path),
-            show_default=False
-        )
+        new_path = Path(
+            Prompt.ask(
+                "New path (press Enter to keep current)",
+                default=str(repo.path),
+                show_default=False
+            )
+        ).expanduser().resolve()
         
-        if new_path != str(repo.path):
-            new_path = Path(new_path).expanduser().resolve()
-            if not new_path.exists():
-                console.print(f"[yellow]Warning: Path '{new_path}' does not exist.[/]")
-                if not force and not Confirm.ask("Continue anyway?", default=False):
-                    console.print("Edit cancelled.")
-                    raise typer.Exit(0)
+        if str(new_path) != str(repo.path) and not new_path.exists():
+            console.print(f"[yellow]Warning: Path '{new_path}' does not exist.[/]")
+            if not force and not Confirm.ask("Continue anyway?", default=False):
+                console.print("Edit cancelled.")
+                raise typer.Exit(0)
     else:
-        new_path = Path(path).expanduser().resolve() if path else repo.path
+        new_path = Path(path or repo.path).expanduser().resolve()
         new_name = new_name or repo_name
     
     # Check if new name conflicts with existing repositories
-    if new_name.lower() != repo_name.lower() and new_name.lower() in (
-        n.lower() for n in config.repos if n != repo_name
-    ):
+    conflict = config.find_repo(new_name)
+    if new_name.lower() != repo_name.lower() and conflict is not None:
         console.print(f"[red]Error: A repository named '{new_name}' already exists.[/]")
         raise typer.Exit(1)
     
     # Check if new path is already tracked
-    if str(new_path) != str(repo.path) and any(
-        str(r.path) == str(new_path) for n, r in config.repos.items() if n != repo_name
-    ):
+    if str(new_path) != str(repo.path) and config.find_repo_by_path(new_path) not in (None, repo_name):
         console.print(f"[red]Error: Path '{new_path}' is already tracked.[/]")
         raise typer.Exit(1)
     
@@ -93,22 +88,23 @@ def edit_repository(
         console.print("No changes to make.")
         return
     
-    console.print("\nChanges to be made:")
-    for change in changes:
-        console.print(f"- {change}")
+    console.print("\n".join(["\nChanges to be made:"] + [f"- {change}" for change in changes]))
     
     if not force and not Confirm.ask("\nApply these changes?"):
         console.print("Edit cancelled.")
         return
     
     # Apply changes
+    # Reuse the entry so plugins and enabled survive a rename
     if repo_name != new_name:
-        config.repos[new_name] = RepoConfig(path=new_path)
-        del config.repos[repo_name]
-    else:
-        config.repos[repo_name].path = new_path
+        repo = config.repos.pop(repo_name)
+        repo.name = new_name
+        config.repos[new_name] = repo
+    repo.path = str(new_path)
     
     config.save()
-    console.print(f"\n[green]✓ Successfully updated repository.[/]")
-    console.print(f"Name: {new_name}")
-    console.print(f"Path: {new_path}")
+    console.print(
+        f"\n[green]✓ Successfully updated repository.[/]\n"
+        f"Name: {new_name}\n"
+        f"Path: {new_path}"
+    )
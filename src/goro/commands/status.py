@@ -1,16 +1,24 @@
 """Status commands for GORO."""
 
+import asyncio
+import os
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
-from rich.table import Table
 
 from goro.config import Config
 
 console = Console()
 
+# Machine-readable status: empty output means a clean working tree
+PORCELAIN_STATUS = ["git", "status", "--porcelain=v1", "-z"]
+
+def _porcelain_env() -> Dict[str, str]:
+    """Environment for porcelain calls; no locale lookups are needed."""
+    return {**os.environ, "LC_ALL": "C"}
+
 def get_git_status(repo_path: Path) -> Tuple[bool, str]:
     """Get the git status of a repository.
     
@@ -21,25 +29,69 @@ def get_git_status(repo_path: Path) -> Tuple[bool, str]:
         Tuple of (is_clean, status_output)
     """
     try:
-        # Check if the directory is a git repository
-        result = subprocess.run(
+        # Check if the directory is a git repository and whether it is clean
+        porcelain = subprocess.run(
+            PORCELAIN_STATUS,
+            cwd=repo_path,
+            capture_output=True,
+            check=False,
+            env=_porcelain_env()
+        )
+        
+        if porcelain.returncode != 0:
+            return False, porcelain.stderr.decode(errors="replace") or "Unknown error"
+        
+        if not porcelain.stdout:
+            return True, ""
+        
+        # Only render the full human-readable status for dirty trees
+        text_result = subprocess.run(
             ["git", "status"],
             cwd=repo_path,
             capture_output=True,
-            text=True,
             check=False
         )
-        
-        if result.returncode != 0:
-            return False, result.stderr or "Unknown error"
-            
-        status_output = result.stdout.strip()
-        is_clean = "nothing to commit, working tree clean" in status_output
-        return is_clean, status_output
+        return False, text_result.stdout.decode(errors="replace").strip()
         
     except Exception as e:
         return False, f"Error checking status: {str(e)}"
 
+async def is_repo_clean(repo_path: Path) -> bool:
+    """Check whether a repository has no uncommitted changes.
+    
+    Uses porcelain status output, which is empty for a clean tree.
+    
+    Args:
+        repo_path: Path to the git repository
+        
+    Returns:
+        bool: True if the working tree is clean, False otherwise
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *PORCELAIN_STATUS,
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_porcelain_env()
+        )
+        stdout, _ = await process.communicate()
+    except Exception:
+        return False
+    
+    return process.returncode == 0 and not stdout
+
+async def check_all_clean(repo_paths: List[Path]) -> List[bool]:
+    """Check several repositories concurrently.
+    
+    Args:
+        repo_paths: Paths of the repositories to check
+        
+    Returns:
+        List of clean flags in the same order as ``repo_paths``
+    """
+    return await asyncio.gather(*(is_repo_clean(path) for path in repo_paths))
+
 def status_repo(name: str) -> None:
     """Show status of a single repository.
     
@@ -49,17 +101,16 @@ def status_repo(name: str) -> None:
     config = Config.load()
     
     # Case-insensitive search for the repository
-    repo_name = next((n for n in config.repos if n.lower() == name.lower()), None)
+    repo_name = config.find_repo(name)
     
     if not repo_name:
         console.print(f"[red]Error: Repository '{name}' not found.[/]")
-        console.print("Available repositories:")
-        for repo in config.repos:
-            console.print(f"- {repo}")
+        lines = ["Available repositories:"] + [f"- {repo}" for repo in config.repos]
+        console.print("\n".join(lines))
         return
         
     repo = config.repos[repo_name]
-    is_clean, status = get_git_status(repo.path)
+    is_clean, status = get_git_status(repo.path_obj)
     
     console.print(f"\n[bold]Repository:[/] {name}")
     console.print(f"[bold]Path:[/] {repo.path}\n")
@@ -72,6 +123,8 @@ def status_repo(name: str) -> None:
 
 def status_all() -> None:
     """Show status of all tracked repositories."""
+    from rich.table import Table
+    
     config = Config.load()
     
     if not config.repos:
@@ -83,9 +136,12 @@ def status_all() -> None:
     table.add_column("Status", style="green")
     table.add_column("Path", style="magenta")
     
-    for name, repo in config.repos.items():
-        is_clean, _ = get_git_status(repo.path)
+    # Run every git status at once; rows are added once they all finish
+    repos = list(config.repos.items())
+    results = asyncio.run(check_all_clean([repo.path_obj for _, repo in repos]))
+    
+    for (name, repo), is_clean in zip(repos, results):
         status = "[green]Clean" if is_clean else "[yellow]Dirty"
-        table.add_row(name, status, str(repo.path))
+        table.add_row(name, status, repo.path)
     
     console.print(table)
@@ -2,22 +2,45 @@
 
 import asyncio
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from goro.config import Config
+from goro.config import Config, RepoConfig
+from goro.git import git_env
 
 console = Console()
 
-async def run_git_command(cmd: List[str], cwd: Path) -> Tuple[bool, List[str]]:
+# Shared by the async and threaded syncs
+PULL_COMMAND = ["git", "pull"]
+
+def _output_lines(stdout: bytes) -> List[str]:
+    """Decode git output once and keep its non-empty lines, stripped."""
+    return [
+        line.strip()
+        for line in stdout.decode(errors="replace").splitlines()
+        if line.strip()  # Only log non-empty lines
+    ]
+
+# Output git prints when it needed credentials it could not ask for
+_AUTH_FAILURE_MARKERS = (
+    "terminal prompts disabled",
+    "Authentication failed",
+    "Permission denied",
+)
+
+async def run_git_command(
+    cmd: List[str], cwd: Path, env: Optional[Dict[str, str]] = None
+) -> Tuple[bool, List[str]]:
     """Run a git command and capture its output.
     
     Args:
         cmd: List of command arguments
         cwd: Working directory for the command
+        env: Environment for the command; the current one if not given
         
     Returns:
         Tuple of (success, output_lines)
@@ -26,25 +49,56 @@ async def run_git_command(cmd: List[str], cwd: Path) -> Tuple[bool, List[str]]:
         process = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=cwd,
+            env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT
         )
         
-        output = []
-        while True:
-            line = await process.stdout.readline()
-            if not line:
-                break
-            line = line.decode().strip()
-            if line:  # Only log non-empty lines
-                output.append(line)
-        
-        await process.wait()
-        return process.returncode == 0, output
+        # One read to EOF, then one decode, instead of a readline per line
+        stdout, _ = await process.communicate()
+        return process.returncode == 0, _output_lines(stdout)
         
     except Exception as e:
         return False, [f"Error: {str(e)}"]
 
+# Upper bound on repositories synced at once, to spare shared remotes
+MAX_CONCURRENT_SYNCS = 8
+
+async def _sync_repo(
+    repo_name: str, repo: RepoConfig, env: Optional[Dict[str, str]] = None
+) -> Tuple[bool, List[str]]:
+    """Pull one repository.
+    
+    Args:
+        repo_name: Name the repository is tracked under
+        repo: The repository configuration
+        env: Environment for git; the current one if not given
+        
+    Returns:
+        Tuple of (success, lines to print), so concurrent syncs don't interleave
+    """
+    # git pull fetches by itself; a separate fetch would contact the remote twice
+    success, output = await run_git_command(PULL_COMMAND, repo.path_obj, env)
+    return _result_lines(repo_name, success, output)
+
+def _result_lines(repo_name: str, success: bool, output: List[str]) -> Tuple[bool, List[str]]:
+    """Pair a pull's success with the lines that describe its outcome."""
+    if not success:
+        lines = [f"[red]✗ Error syncing {repo_name}:[/]"] + [f"  {line}" for line in output]
+        if any(marker in line for line in output for marker in _AUTH_FAILURE_MARKERS):
+            lines.append(
+                f"  [yellow]Credentials are needed; run 'goro sync {repo_name}' "
+                "to enter them.[/]"
+            )
+        return False, lines
+    
+    changes = [line for line in output if not line.startswith('Already up to date')]
+    if changes:
+        return True, [f"[green]✓ Successfully synced {repo_name}[/]"] + [
+            f"  {line}" for line in changes
+        ]
+    return True, [f"[green]✓ {repo_name} is already up to date[/]"]
+
 async def sync_repository(name: str, show_header: bool = False) -> bool:
     """Synchronize a single repository.
     
@@ -58,7 +112,7 @@ async def sync_repository(name: str, show_header: bool = False) -> bool:
     config = Config.load()
     
     # Case-insensitive search for the repository
-    repo_name = next((n for n in config.repos if n.lower() == name.lower()), None)
+    repo_name = config.find_repo(name)
     
     if not repo_name:
         console.print(f"[red]Error: Repository '{name}' not found.[/]")
@@ -67,44 +121,67 @@ async def sync_repository(name: str, show_header: bool = False) -> bool:
     if show_header:
         console.print(f"\n[bold]=== Syncing {repo_name} ===[/]")
     
-    repo = config.repos[repo_name]
-    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        task = progress.add_task(f"Syncing {repo_name}...", total=100)
-        
-        # Fetch changes
-        success, output = await run_git_command(["git", "fetch"], repo.path)
-        if not success:
-            progress.print(f"[red]Error fetching changes for {repo_name}:[/]")
-            for line in output:
-                progress.print(f"  {line}")
-            return False
-        
-        # Pull changes
-        success, output = await run_git_command(["git", "pull"], repo.path)
-        progress.update(task, completed=100)
-        
-        if success:
-            if output and any(not line.startswith('Already up to date') for line in output):
-                console.print(f"[green]✓ Successfully synced {repo_name}[/]")
-                for line in output:
-                    if line.strip() and not line.startswith('Already up to date'):
-                        console.print(f"  {line}")
-            else:
-                console.print(f"[green]✓ {repo_name} is already up to date[/]")
-            return True
-        else:
-            console.print(f"[red]✗ Error syncing {repo_name}:[/]")
-            for line in output:
-                console.print(f"  {line}")
-            return False
+        progress.add_task(f"Syncing {repo_name}...", total=None)
+        success, lines = await _sync_repo(repo_name, config.repos[repo_name])
+    
+    for line in lines:
+        console.print(line)
+    return success
 
 async def sync_all_repositories() -> None:
-    """Synchronize all tracked repositories."""
+    """Synchronize all tracked repositories concurrently."""
+    config = Config.load()
+    
+    if not config.repos:
+        console.print("[yellow]No repositories to sync.[/]")
+        return
+    
+    console.print("\n[bold]Starting sync for all repositories:[/]")
+    
+    semaphore = asyncio.Semaphore(min(len(config.repos), MAX_CONCURRENT_SYNCS))
+    # Concurrent pulls can't share the terminal, so git fails instead of
+    # prompting for credentials and the failure is reported per repository
+    env = git_env()
+    
+    async def sync_one(repo_name: str, repo: RepoConfig) -> bool:
+        async with semaphore:
+            try:
+                success, lines = await _sync_repo(repo_name, repo, env)
+            except Exception as e:
+                success, lines = False, [f"[red]✗ Error syncing {repo_name}:[/]", f"  {e}"]
+        # Printed without awaiting in between, so each block stays together
+        console.print(f"\n[bold]=== Syncing {repo_name} ===[/]")
+        for line in lines:
+            console.print(line)
+        return success
+    
+    await asyncio.gather(*(sync_one(name, repo) for name, repo in config.repos.items()))
+    
+    console.print("\n[bold]All repositories synced.[/]")
+
+def _pull_blocking(repo_name: str, repo: RepoConfig) -> Tuple[bool, List[str]]:
+    """Pull one repository with a blocking subprocess call, for worker threads."""
+    try:
+        result = subprocess.run(
+            PULL_COMMAND,
+            cwd=repo.path_obj,
+            # Worker threads can't share the terminal either; fail, don't prompt
+            env=git_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        output = _output_lines(result.stdout)
+        return _result_lines(repo_name, result.returncode == 0, output)
+    except Exception as e:
+        return _result_lines(repo_name, False, [f"Error: {str(e)}"])
+
+def sync_all_repositories_threaded() -> None:
+    """Synchronize all tracked repositories on a thread pool, without asyncio."""
     config = Config.load()
     
     if not config.repos:
@@ -113,9 +190,17 @@ async def sync_all_repositories() -> None:
     
     console.print("\n[bold]Starting sync for all repositories:[/]")
     
-    # Run syncs sequentially for better output readability
-    for name in config.repos:
-        console.print(f"\n[bold]=== Syncing {name} ===[/]")
-        await sync_repository(name)
+    workers = min(len(config.repos), MAX_CONCURRENT_SYNCS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_pull_blocking, name, repo): name
+            for name, repo in config.repos.items()
+        }
+        # Results are printed here, on the calling thread, so no lock is needed
+        for future in as_completed(futures):
+            _, lines = future.result()
+            console.print(f"\n[bold]=== Syncing {futures[future]} ===[/]")
+            for line in lines:
+                console.print(line)
     
     console.print("\n[bold]All repositories synced.[/]")
@@ -1,105 +1,393 @@
 """Configuration management for GORO."""
 
 import json
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+try:
+    import orjson
 
+    _HAS_ORJSON = True
+except ImportError:  # the optional "orjson" extra; json is used instead
+    _HAS_ORJSON = False
 
-class RepoConfig(BaseModel):
-    """Configuration for a single repository."""
 
-    name: str
-    path: Path
-    plugins: List[str] = Field(default_factory=list)
-    enabled: bool = True
+# Flags for the temporary file save() writes; O_CLOEXEC and O_BINARY are
+# platform-specific
+_WRITE_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
 
-    class Config:
-        json_encoders = {Path: str}
-        arbitrary_types_allowed = True
 
-    def __init__(self, **data):
-        if "path" in data and not isinstance(data["path"], Path):
-            data["path"] = Path(data["path"]).expanduser().resolve()
-        super().__init__(**data)
-    
-    def dict(self, **kwargs):
-        """Override dict() to ensure path is serialized as string."""
-        d = super().dict(**kwargs)
-        d["path"] = str(d["path"])
-        return d
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize the configuration as indented UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
-class Config(BaseModel):
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes; orjson's errors subclass json.JSONDecodeError."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class RepoConfig:
+    """Configuration for a single repository.
+
+    Written out with ``__slots__`` instead of as a dataclass, since
+    ``dataclass(slots=True)`` needs Python 3.10; entries carry no per-instance
+    ``__dict__``.
+    """
+
+    __slots__ = ("name", "path", "plugins", "enabled")
+
+    def __init__(
+        self,
+        name: str,
+        path: Union[Path, str],
+        plugins: Optional[List[str]] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.name = name
+        # Canonical absolute path, stored as it is written to the config file
+        self.path = str(path)
+        self.plugins: List[str] = plugins if plugins is not None else []
+        self.enabled = enabled
+
+    def __repr__(self) -> str:
+        return (
+            f"RepoConfig(name={self.name!r}, path={self.path!r}, "
+            f"plugins={self.plugins!r}, enabled={self.enabled!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RepoConfig):
+            return NotImplemented
+        return (self.name, self.path, self.plugins, self.enabled) == (
+            other.name,
+            other.path,
+            other.plugins,
+            other.enabled,
+        )
+
+    # Mutable, like the dataclass it replaces
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def path_obj(self) -> Path:
+        """The repository path as a Path."""
+        return Path(self.path)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RepoConfig":
+        """Build a repository entry from its JSON form, ignoring unknown keys.
+
+        Stored paths were canonicalized when they were added, so they are not
+        resolved again; only a leading ``~`` from a hand edit is expanded.
+        """
+        return cls(
+            name=data["name"],
+            path=os.path.expanduser(data["path"]),
+            plugins=list(data.get("plugins", [])),
+            enabled=data.get("enabled", True),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON form of this entry, with the path as a string."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "plugins": list(self.plugins),
+            "enabled": self.enabled,
+        }
+
+
+@dataclass
+class Config:
     """Main configuration class for the application."""
 
-    repos: Dict[str, RepoConfig] = Field(default_factory=dict)
-    default_plugins: List[str] = Field(default_factory=list)
+    repos: Dict[str, RepoConfig] = field(default_factory=dict)
+    default_plugins: List[str] = field(default_factory=list)
     config_path: Optional[Path] = None
 
-    class Config:
-        json_encoders = {Path: str}
+    # Location of the configuration file, resolved once per process
+    _cached_config_path: ClassVar[Optional[Path]] = None
+
+    # Last configuration loaded in this process, keyed by (mtime_ns, size)
+    _load_cache: ClassVar[Optional[Tuple[Tuple[int, int], "Config"]]] = None
+
+    # Lowercased name -> tracked name, built on first lookup
+    _lower_names: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Repository path -> tracked name, built on first lookup
+    _path_index: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Bytes last written to the file and its (mtime_ns, size) afterwards
+    _last_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _last_stamp: Optional[Tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Set by add_repo/remove_repo until the change is written by commit()
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Config":
+        """Build a configuration from its JSON form."""
+        config_path = data.get("config_path")
+        return cls(
+            repos={
+                name: RepoConfig.from_dict(repo)
+                for name, repo in data.get("repos", {}).items()
+            },
+            default_plugins=list(data.get("default_plugins", [])),
+            config_path=Path(config_path) if config_path is not None else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON form written by save(); config_path is not stored."""
+        return {
+            "repos": {name: repo.to_dict() for name, repo in self.repos.items()},
+            "default_plugins": list(self.default_plugins),
+        }
 
     @classmethod
     def get_config_path(cls) -> Path:
-        """Get the path to the configuration file."""
-        config_dir = Path.home() / ".config" / "goro"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "config.json"
+        """Get the path to the configuration file.
+
+        The directory is created on first use; the result is cached for the
+        rest of the process.
+        """
+        if Config._cached_config_path is None:
+            config_dir = Path.home() / ".config" / "goro"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            Config._cached_config_path = config_dir / "config.json"
+        return Config._cached_config_path
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        The parsed configuration is cached for the rest of the process and
+        reused for as long as the file on disk is unchanged.
+        """
         config_path = cls.get_config_path()
-        if not config_path.exists():
+        try:
+            stamp = cls._file_stamp(config_path)
+        except OSError:
             return cls()
 
+        if cls._load_cache is not None and cls._load_cache[0] == stamp:
+            return cls._load_cache[1]
+
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return cls(**data)
+            raw = config_path.read_bytes()
+            config = cls.from_dict(_loads(raw))
         except (json.JSONDecodeError, OSError) as e:
             # If there's an error loading the config, return a default one
             return cls()
 
-    def save(self) -> None:
-        """Save configuration to file."""
+        # Keep what was read so an unchanged save() needs no I/O
+        config._last_bytes = raw
+        config._last_stamp = stamp
+        Config._load_cache = (stamp, config)
+        return config
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the configuration file if it changed on disk.
+
+        Useful when the file may have been edited outside this process. Costs
+        a single stat() when the file is unchanged.
+
+        Returns:
+            bool: True if the file changed and this instance was updated
+        """
         config_path = self.get_config_path()
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as f:
-            # Convert all Path objects to strings before serialization
-            config_dict = self.dict(
-                exclude={"config_path"},
-                exclude_none=True,
-            )
-            # Ensure all paths in repos are strings
-            if "repos" in config_dict:
-                for repo_name, repo_data in config_dict["repos"].items():
-                    if isinstance(repo_data, dict) and "path" in repo_data:
-                        repo_data["path"] = str(repo_data["path"])
-            
-            json.dump(
-                config_dict,
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
-
-    def add_repo(self, name: str, path: Path) -> None:
+        try:
+            stamp = self._file_stamp(config_path)
+            if stamp == self._last_stamp:
+                return False
+            raw = config_path.read_bytes()
+            fresh = self.from_dict(_loads(raw))
+        except (json.JSONDecodeError, OSError):
+            return False
+
+        self.repos = fresh.repos
+        self.default_plugins = fresh.default_plugins
+        self._lower_names = None
+        self._path_index = None
+        self._last_bytes = raw
+        self._last_stamp = stamp
+        Config._load_cache = (stamp, self)
+        return True
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Tuple[int, int]:
+        """Return the (mtime_ns, size) pair used to detect file changes."""
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def find_repo(self, name: str) -> Optional[str]:
+        """Find a tracked repository name, ignoring case.
+
+        Args:
+            name: Repository name to look up
+
+        Returns:
+            Optional[str]: The name as stored in the configuration, or None
+        """
+        if self._lower_names is None:
+            lower_names: Dict[str, str] = {}
+            for repo_name in self.repos:
+                lower_names.setdefault(repo_name.lower(), repo_name)
+            self._lower_names = lower_names
+        return self._lower_names.get(name.lower())
+
+    def find_repo_by_path(self, path: Path) -> Optional[str]:
+        """Find the name of the repository tracked at a path.
+
+        Stored paths are already canonical, so no filesystem access is needed.
+
+        Args:
+            path: Resolved path to look up
+
+        Returns:
+            Optional[str]: The name of the repository at that path, or None
+        """
+        if self._path_index is None:
+            path_index: Dict[str, str] = {}
+            for repo_name, repo in self.repos.items():
+                path_index.setdefault(repo.path, repo_name)
+            self._path_index = path_index
+        return self._path_index.get(str(path))
+
+    def save(self) -> None:
+        """Save configuration to file.
+
+        Nothing is written when the serialized configuration matches what this
+        instance last wrote and the file hasn't changed since. Otherwise the
+        file is replaced atomically, so a crash mid-write can't truncate it.
+        """
+        data = self.serialize_pending()
+        if data is None:
+            return
+        try:
+            stamp = self.write_serialized(data)
+        except BaseException:
+            self.mark_dirty()
+            raise
+        self.mark_written(data, stamp)
+
+    def serialize_pending(self) -> Optional[bytes]:
+        """Encode the configuration for writing and clear the dirty flag.
+
+        This reads repos, so callers that write from another thread must call
+        it on the thread that mutates the configuration and hand only the
+        bytes to write_serialized(). Changes made after this call mark the
+        instance dirty again.
+
+        Returns:
+            The bytes to write, or None when the file already holds them
+        """
+        self._lower_names = None
+        self._path_index = None
+        # to_dict() already stores every path as a string
+        data = _dumps(self.to_dict())
+        self._dirty = False
+
+        if data == self._last_bytes:
+            try:
+                if self._file_stamp(self.get_config_path()) == self._last_stamp:
+                    return None
+            except OSError:
+                pass
+        return data
+
+    @classmethod
+    def write_serialized(cls, data: bytes) -> Tuple[int, int]:
+        """Atomically replace the configuration file with `data`.
+
+        Touches only the filesystem, so it is safe to run in a worker thread.
+
+        Returns:
+            The new file's (mtime_ns, size) stamp
+        """
+        # get_config_path() has already created the directory
+        config_path = cls.get_config_path()
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+        # One unbuffered write of the pre-encoded bytes; the file is private
+        fd = os.open(tmp_path, _WRITE_FLAGS, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, config_path)
+        return cls._file_stamp(config_path)
+
+    def mark_written(self, data: bytes, stamp: Tuple[int, int]) -> None:
+        """Record that `data` is now on disk with the given stamp."""
+        self._last_bytes = data
+        self._last_stamp = stamp
+        # The file now matches what this instance serialized, so later
+        # loads can reuse it unless it has changed since
+        if not self._dirty:
+            Config._load_cache = (stamp, self)
+
+    @property
+    def dirty(self) -> bool:
+        """True while add_repo/remove_repo changes are waiting to be written."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Flag the configuration as needing a write, e.g. after a failed one."""
+        self._dirty = True
+
+    def commit(self) -> bool:
+        """Write pending add_repo/remove_repo changes to disk.
+
+        Returns:
+            bool: True if there were pending changes to write
+        """
+        if not self._dirty:
+            return False
+        self.save()
+        return True
+
+    def add_repo(self, name: str, path: Union[Path, str]) -> None:
         """Add a new repository to the configuration.
 
+        The change is kept in memory until commit() or save() is called.
+
         Args:
             name: Short name for the repository
-            path: Path to the repository
+            path: Path to the repository; a Path is stored as-is and must
+                already be resolved, a string is expanded and resolved
         """
-        self.repos[name] = RepoConfig(name=name, path=path)
-        self.save()
+        if not isinstance(path, Path):
+            path = Path(path).expanduser().resolve()
+        self.repos[name] = RepoConfig(name=name, path=str(path))
+        self._lower_names = None
+        self._path_index = None
+        self._dirty = True
 
     def remove_repo(self, name: str) -> bool:
         """Remove a repository from the configuration.
 
+        The change is kept in memory until commit() or save() is called.
+
         Args:
             name: Name of the repository to remove
 
@@ -108,6 +396,8 @@ class Config(BaseModel):
         """
         if name in self.repos:
             del self.repos[name]
-            self.save()
+            self._lower_names = None
+            self._path_index = None
+            self._dirty = True
             return True
         return False
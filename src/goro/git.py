@@ -0,0 +1,25 @@
+"""Helpers shared by everything that runs git for GORO."""
+
+import os
+from typing import Dict
+
+
+def git_env(**overrides: str) -> Dict[str, str]:
+    """Environment for non-interactive git subprocesses.
+
+    Credential prompts are disabled so a command fails instead of waiting on
+    a terminal nobody is watching, and optional locks are skipped so read-only
+    commands such as ``git status`` don't contend for the index lock.
+
+    Args:
+        **overrides: Extra variables to set on top of the defaults
+
+    Returns:
+        Dict[str, str]: A copy of ``os.environ`` with the git settings applied
+    """
+    return {
+        **os.environ,
+        "GIT_TERMINAL_PROMPT": "0",
+        "GIT_OPTIONAL_LOCKS": "0",
+        **overrides,
+    }
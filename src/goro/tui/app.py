@@ -1,7 +1,7 @@
 """Main Textual application for GORO."""
 
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from rich.panel import Panel
 from rich.table import Table
@@ -9,6 +9,7 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -26,6 +27,7 @@ from textual.widgets import (
 )
 
 from goro.config import Config, RepoConfig
+from goro.git import git_env
 
 # Import widgets and dialogs
 from .widgets import RepoList, RepoDetails, StatusBar
@@ -33,10 +35,27 @@ from .dialogs.repo_dialog import RepoDialog
 from .dialogs.confirm_dialog import ConfirmDialog
 from .dialogs.status_dialog import StatusDialog
 from .dialogs.sync_dialog import SyncDialog
-from .utils import safe_id, is_valid_repo_name, resolve_path
+from .utils import is_valid_repo_name, resolve_path, run_in_thread
 import asyncio
+import os
 from pathlib import Path
 
+
+def _install_uvloop() -> None:
+    """Use uvloop for the event loop when it is installed.
+
+    Set GORO_NO_UVLOOP=1 to keep the stock asyncio loop, e.g. when profiling.
+    uvloop is not available on Windows, where the default loop is kept.
+    """
+    if os.environ.get("GORO_NO_UVLOOP"):
+        return
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 class GRMApp(App):
     """GORO Textual Application."""
 
@@ -55,8 +74,23 @@ class GRMApp(App):
 
     def __init__(self):
         super().__init__()
-        self.config = Config.load()
-        self.selected_repo = None
+        # Empty until _load_config has read the file off the event loop
+        self.config = Config()
+        self._config_loaded = False
+        self.selected_repo: Optional[str] = None
+        # The RepoConfig for selected_repo, kept alongside to skip re-lookups
+        self.selected_repo_obj: Optional[RepoConfig] = None
+        # Pending debounced write of the configuration
+        self._commit_timer: Optional[Timer] = None
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the app, on uvloop when it is installed.
+
+        The loop policy is process-wide, so it is only set here, when goro
+        itself starts the app, and not as a side effect of importing it.
+        """
+        _install_uvloop()
+        return super().run(*args, **kwargs)
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the goro."""
@@ -83,29 +117,84 @@ class GRMApp(App):
     def on_mount(self) -> None:
         """Handle app mount event."""
         self.title = "GORO"
+        self.sub_title = "Loading configuration..."
+        
+        # Look the long-lived widgets up once instead of on every event
+        self._repo_list = self.query_one("#repo-list", RepoList)
+        self._details = self.query_one(RepoDetails)
+        self._status_bar = self.query_one(StatusBar)
+        
+        # Paint first; the configuration arrives from a worker thread
+        self.run_worker(self._load_config(), exclusive=True)
+
+    async def _load_config(self) -> None:
+        """Read the configuration file off the event loop and show it."""
+        self._apply_config(await run_in_thread(Config.load))
+
+    def _apply_config(self, config: Config) -> None:
+        """Make `config` the app's configuration and refresh the list."""
+        self.config = config
+        self._config_loaded = True
         self.sub_title = f"Managing {len(self.config.repos)} repositories"
         
         # Initialize the repository list with all repositories
         if self.config.repos:
-            repo_list = self.query_one("#repo-list", RepoList)
-            repo_list.repos = self.config.repos
+            self._repo_list.repos = self.config.repos
             
             # Select the first repository
             first_repo = next(iter(self.config.repos))
             self.selected_repo = first_repo
-            details = self.query_one(RepoDetails)
-            details.update_repo(self.config.repos[first_repo])
+            self.selected_repo_obj = self.config.repos[first_repo]
+            self._details.update_repo(self.selected_repo_obj)
+
+    def on_unmount(self) -> None:
+        """Write any configuration changes still waiting on the debounce timer."""
+        self.config.commit()
+        resolve_path.cache_clear()
+
+    def schedule_commit(self, delay: float = 0.25) -> None:
+        """Write the configuration once mutations have settled for `delay` seconds."""
+        if self._commit_timer is not None:
+            self._commit_timer.stop()
+        self._commit_timer = self.set_timer(delay, self._commit_config)
+
+    async def _commit_config(self) -> None:
+        """Write pending configuration changes off the event loop."""
+        self._commit_timer = None
+        config = self.config
+        if not config.dirty:
+            return
+        # Serialize here, where the handlers mutate repos; only the
+        # file write runs in the worker thread
+        data = config.serialize_pending()
+        if data is None:
+            return
+        try:
+            stamp = await run_in_thread(Config.write_serialized, data)
+        except OSError as e:
+            # Keep the changes pending so a later commit retries them
+            config.mark_dirty()
+            self.notify(f"Error saving configuration: {str(e)}", severity="error")
+            return
+        config.mark_written(data, stamp)
 
     def on_repo_list_selected(self, event: RepoList.Selected) -> None:
         """Handle repository selection."""
+        # Re-selecting the current row changes nothing
+        if event.repo_name == self.selected_repo:
+            return
         self.selected_repo = event.repo_name
-        repo = self.config.repos.get(self.selected_repo)
-        details = self.query_one(RepoDetails)
-        details.update_repo(repo)
-        self.query_one(StatusBar).status = f"Selected: {self.selected_repo}"
+        self.selected_repo_obj = self.config.repos.get(self.selected_repo)
+        self._details.update_repo(self.selected_repo_obj)
+        self._status_bar.status = f"Selected: {self.selected_repo}"
 
     async def action_add_repo(self) -> None:
         """Add a new repository."""
+        if not self._config_loaded:
+            # Adding to the empty placeholder would overwrite the file on commit
+            self.notify("Configuration is still loading", severity="warning")
+            return
+
         async def handle_dialog_result(result: tuple[str, Path] | None) -> None:
             if not result:
                 return  # User cancelled
@@ -119,25 +208,36 @@ class GRMApp(App):
                     severity="error"
                 )
                 return
+            
+            # Check for duplicate path
+            existing = self.config.find_repo_by_path(path)
+            if existing is not None:
+                self.notify(
+                    f"A repository at this path already exists with name '{existing}'",
+                    severity="error"
+                )
+                return
                 
             try:
                 # Add the new repository
-                self.config.add_repo(name, str(path))
-                self.config.save()
-                
-                # Update the UI
-                self.query_one(StatusBar).status = f"Added repository: {name}"
-                
-                # Update the repository list
-                repo_list = self.query_one("#repo-list", RepoList)
-                repo_list.repos = self.config.repos
+                self.config.add_repo(name, path)
+                self.schedule_commit()
                 
-                # Select the new repository
-                self.selected_repo = name
-                
-                # Update the details view
-                details = self.query_one(RepoDetails)
-                details.update_repo(self.config.repos[name])
+                # Update the UI in a single refresh
+                with self.batch_update():
+                    self._status_bar.status = f"Added repository: {name}"
+                    
+                    # Update the repository list
+                    repo = self.config.repos[name]
+                    self._repo_list.add_repo(name)
+                    
+                    # Select the new repository
+                    self.selected_repo = name
+                    self.selected_repo_obj = repo
+                    self._repo_list.select(name)
+                    
+                    # Update the details view
+                    self._details.update_repo(repo)
                 
             except ValueError as e:
                 self.notify(str(e), severity="error")
@@ -147,7 +247,8 @@ class GRMApp(App):
 
     async def action_remove_repo(self) -> None:
         """Remove the selected repository."""
-        if not self.selected_repo:
+        repo_name = self.selected_repo
+        if not repo_name:
             self.notify("No repository selected", severity="warning")
             return
         
@@ -155,28 +256,27 @@ class GRMApp(App):
             if confirmed:
                 try:
                     # Remove the repository
-                    repo_name = self.selected_repo
                     self.config.remove_repo(repo_name)
-                    self.config.save()
-                    
-                    # Update UI
-                    self.query_one(StatusBar).status = f"Removed repository: {repo_name}"
-                    self.selected_repo = None
+                    self.schedule_commit()
                     
-                    # Refresh the repository list
-                    repo_list = self.query_one("#repo-list", RepoList)
-                    repo_list.repos = self.config.repos
-                    
-                    # Clear details
-                    details = self.query_one(RepoDetails)
-                    details.update_repo(None)
+                    # Update UI in a single refresh
+                    with self.batch_update():
+                        self._status_bar.status = f"Removed repository: {repo_name}"
+                        self.selected_repo = None
+                        self.selected_repo_obj = None
+                        
+                        # Refresh the repository list
+                        self._repo_list.remove_repo(repo_name)
+                        
+                        # Clear details
+                        self._details.update_repo(None)
                     
                 except Exception as e:
                     self.notify(f"Error removing repository: {str(e)}", severity="error")
         
         # Create and show the dialog
         dialog = ConfirmDialog(
-            f"Are you sure you want to remove '{self.selected_repo}'?",
+            f"Are you sure you want to remove '{repo_name}'?",
             confirm_text="Remove",
             cancel_text="Cancel"
         )
@@ -186,11 +286,12 @@ class GRMApp(App):
 
     async def action_edit_repo(self) -> None:
         """Edit the selected repository."""
-        if not self.selected_repo:
+        repo_name = self.selected_repo
+        if repo_name is None or self.selected_repo_obj is None:
             self.notify("No repository selected", severity="warning")
             return
             
-        repo = self.config.repos[self.selected_repo]
+        repo = self.selected_repo_obj
         
         async def handle_dialog_result(result: tuple[str, str, Path] | None) -> None:
             if not result:
@@ -208,80 +309,78 @@ class GRMApp(App):
                     return
                 
                 # Check for duplicate path
-                for repo_name, repo in self.config.repos.items():
-                    if repo_name != old_name and Path(repo.path).resolve() == new_path:
-                        self.notify(
-                            f"A repository at this path already exists with name '{repo_name}'",
-                            severity="error"
-                        )
-                        return
+                collision = self.config.find_repo_by_path(new_path)
+                if collision is not None and collision != old_name:
+                    self.notify(
+                        f"A repository at this path already exists with name '{collision}'",
+                        severity="error"
+                    )
+                    return
                 
                 # Remove the old repository if name changed
                 if old_name != new_name:
                     self.config.remove_repo(old_name)
                 
                 # Add/update the repository
-                self.config.add_repo(new_name, str(new_path))
-                self.config.save()
+                self.config.add_repo(new_name, new_path)
+                self.schedule_commit()
                 
-                # Update UI
-                self.selected_repo = new_name
-                self.query_one(StatusBar).status = f"Updated repository: {new_name}"
-                
-                # Refresh the repository list
-                repo_list = self.query_one("#repo-list", RepoList)
-                repo_list.repos = self.config.repos
-                
-                # Select the updated repository
-                for i, item in enumerate(repo_list.children):
-                    if item.id == safe_id(new_name):
-                        repo_list.index = i
-                        break
-                
-                # Update the details view
-                details = self.query_one(RepoDetails)
-                details.update_repo(self.config.repos[new_name])
+                # Update UI in a single refresh
+                with self.batch_update():
+                    self.selected_repo = new_name
+                    self.selected_repo_obj = self.config.repos[new_name]
+                    self._status_bar.status = f"Updated repository: {new_name}"
+                    
+                    # Refresh the repository list
+                    if old_name != new_name:
+                        self._repo_list.remove_repo(old_name)
+                    self._repo_list.add_repo(new_name)
+                    
+                    # Select the updated repository
+                    self._repo_list.select(new_name)
+                    
+                    # Update the details view
+                    self._details.update_repo(self.selected_repo_obj)
                 
             except Exception as e:
                 self.notify(f"Error updating repository: {str(e)}", severity="error")
         
         # Show the dialog
         self.push_screen(
-            RepoDialog(mode="edit", repo_name=self.selected_repo, repo_path=repo.path),
+            RepoDialog(mode="edit", repo_name=repo_name, repo_path=repo.path),
             handle_dialog_result
         )
 
     async def action_sync_repo(self) -> None:
         """Sync the selected repository with detailed logging."""
-        if not self.selected_repo:
+        repo_name = self.selected_repo
+        if repo_name is None or self.selected_repo_obj is None:
             self.notify("No repository selected", severity="warning")
             return
         
-        repo_name = self.selected_repo
-        repo_path = Path(self.config.repos[repo_name].path)
+        repo_path = self.selected_repo_obj.path_obj
         
-        # Get the status bar instance
-        status_bar = self.query_one("StatusBar")
-        status_bar.log(f"Starting sync for {repo_name}...", "info")
+        self._status_bar.log(f"Starting sync for {repo_name}...", "info")
         
         # Define git commands to run
         commands = [
-            ("git add .", "Adding changes"),
-            ('git commit -m "goro Sync: Auto-commit by GORO" --allow-empty-message', "Committing changes"),
-            ("git pull", "Pulling latest changes"),
-            ("git push", "Pushing changes")
+            (["git", "add", "."], "Adding changes"),
+            (["git", "commit", "-m", "goro Sync: Auto-commit by GORO", "--allow-empty-message"], "Committing changes"),
+            (["git", "pull"], "Pulling latest changes"),
+            (["git", "push"], "Pushing changes")
         ]
         
-        for cmd, description in commands:
-            status_bar.log(f"{description}...", "info")
+        for argv, description in commands:
+            cmd = " ".join(argv)
+            self._status_bar.log(f"{description}...", "info")
             try:
-                # Run the command
-                process = await asyncio.create_subprocess_shell(
-                    cmd,
-                    cwd=repo_path,
+                # Run the command without a shell
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=str(repo_path),
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
-                    shell=True
+                    env=git_env()
                 )
                 
                 # Capture and log output
@@ -293,68 +392,59 @@ class GRMApp(App):
                     line = line.decode().strip()
                     if line:  # Only log non-empty lines
                         output.append(line)
-                        status_bar.log(f"  {line}", "debug")
+                        self._status_bar.log(f"  {line}", "debug")
                 
                 # Wait for process to complete
                 await process.wait()
                 
             except Exception as e:
                 error_msg = f"Error running '{cmd}': {str(e)}"
-                status_bar.log(error_msg, "error")
+                self._status_bar.log(error_msg, "error")
                 self.notify(error_msg, severity="error")
                 return
         
         # Success
-        status_bar.log(f"Successfully synced {repo_name}", "success")
+        self._status_bar.log(f"Successfully synced {repo_name}", "success")
         self.notify(f"Successfully synced {repo_name}", title="Sync Complete")
 
     def action_clear_logs(self) -> None:
         """Clear the status bar logs."""
-        status_bar = self.query_one("StatusBar")
-        status_bar.rich_log.clear()
-        status_bar.log("Logs cleared", "info")
+        self._status_bar.clear()
+        self._status_bar.log("Logs cleared", "info")
         
     async def action_show_status(self) -> None:
         """Show git status for the selected repository."""
-        if not self.selected_repo:
+        repo_name = self.selected_repo
+        if repo_name is None or self.selected_repo_obj is None:
             self.notify("No repository selected", severity="warning")
             return
             
-        repo_name = self.selected_repo
-        repo_path = Path(self.config.repos[repo_name].path)
+        repo_path = self.selected_repo_obj.path_obj
         
-        # Get the status bar instance for logging
-        status_bar = self.query_one("StatusBar")
-        status_bar.log(f"Checking status for {repo_name}...", "info")
+        self._status_bar.log(f"Checking status for {repo_name}...", "info")
         
         try:
-            # Run git status command
-            process = await asyncio.create_subprocess_shell(
-                "git status",
-                cwd=repo_path,
+            # Run git status without a shell; communicate() waits for exit
+            process = await asyncio.create_subprocess_exec(
+                "git", "status",
+                cwd=str(repo_path),
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                shell=True
+                stderr=asyncio.subprocess.PIPE,
+                env=git_env()
             )
+            stdout, stderr = await process.communicate()
             
-            # Capture output
-            output = []
-            while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
-                output.append(line.decode().strip())
-                
-            # Wait for process to complete
-            await process.wait()
+            if process.returncode == 0:
+                status_output = stdout.decode(errors="replace").strip()
+            else:
+                status_output = f"Error: {stderr.decode(errors='replace').strip()}"
             
             # Show status in a dialog
-            status_output = "\n".join(output)
             self.push_screen(StatusDialog(status_output, repo_name))
             
         except Exception as e:
             error_msg = f"Error checking status: {str(e)}"
-            status_bar.log(error_msg, "error")
+            self._status_bar.log(error_msg, "error")
             self.notify(error_msg, severity="error")
 
     def action_sync_all(self) -> None:
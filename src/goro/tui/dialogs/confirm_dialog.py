@@ -3,6 +3,7 @@ from typing import Optional, Tuple, TypeVar, Generic, Type
 from pathlib import Path
 
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Input
@@ -10,6 +11,12 @@ from textual.widgets import Button, Label, Input
 class ConfirmDialog(ModalScreen[bool]):
     """A simple confirmation dialog."""
     
+    # Priority bindings, so Enter confirms even while a button has focus
+    BINDINGS = [
+        Binding("enter", "confirm", show=False, priority=True),
+        Binding("escape", "cancel", show=False, priority=True),
+    ]
+    
     DEFAULT_CSS = """
     ConfirmDialog {
         align: center middle;
@@ -80,9 +87,10 @@ class ConfirmDialog(ModalScreen[bool]):
         else:
             self.dismiss(False)
     
-    async def on_key(self, event) -> None:
-        """Handle key presses in the dialog."""
-        if event.key == "enter":
-            self.dismiss(True)
-        elif event.key == "escape":
-            self.dismiss(False)
+    def action_confirm(self) -> None:
+        """Confirm and close the dialog."""
+        self.dismiss(True)
+    
+    def action_cancel(self) -> None:
+        """Cancel and close the dialog."""
+        self.dismiss(False)
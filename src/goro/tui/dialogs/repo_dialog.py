@@ -6,9 +6,10 @@ from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, Input, Label
 
-from ..utils import is_valid_repo_name, resolve_path
+from ..utils import is_valid_repo_name, aresolve_path, resolve_path
 
 
 class RepoDialog(ModalScreen[Union[Tuple[str, Path], Tuple[str, str, Path], None]]):
@@ -22,17 +23,21 @@ class RepoDialog(ModalScreen[Union[Tuple[str, Path], Tuple[str, str, Path], None
     
     CSS_PATH = "../css/dialogs.tcss"
     
+    # Seconds of no typing before the inputs are checked
+    validation_delay = 0.25
+    
     def __init__(
         self, 
         mode: Literal["add", "edit"], 
         repo_name: str = "", 
-        repo_path: str = "",
+        repo_path: Union[str, Path] = "",
         **kwargs
     ) -> None:
         super().__init__(**kwargs)
         self.mode = mode
         self.original_name = repo_name if mode == "edit" else ""
-        self.original_path = repo_path if mode == "edit" else ""
+        # Converted once here; it is only ever shown as the Input's text
+        self.original_path = str(repo_path) if mode == "edit" else ""
         
         # Set title based on mode
         if mode == "add":
@@ -41,6 +46,9 @@ class RepoDialog(ModalScreen[Union[Tuple[str, Path], Tuple[str, str, Path], None
         else:
             self.title = f"Edit Repository: {repo_name}"
             self.button_text = "Save"
+        
+        # Pending live validation, restarted on every edit
+        self._validation_timer: Optional[Timer] = None
     
     def compose(self) -> ComposeResult:
         """Create the dialog content."""
@@ -48,46 +56,79 @@ class RepoDialog(ModalScreen[Union[Tuple[str, Path], Tuple[str, str, Path], None
             with Container():
                 yield Label(self.title, classes="dialog-header")
                 with Vertical(classes="dialog-content"):
-                    yield Input(
+                    # Kept so the handlers don't have to query for them
+                    self._name_input = Input(
                         value=self.original_name,
                         placeholder="Repository name", 
                         id="repo-name"
                     )
-                    yield Input(
-                        value=str(self.original_path),
+                    self._path_input = Input(
+                        value=self.original_path,
                         placeholder="Repository path", 
                         id="repo-path"
                     )
+                    yield self._name_input
+                    yield self._path_input
+                    self._error_label = Label("", id="error-message")
+                    yield self._error_label
                 with Horizontal(classes="dialog-buttons"):
                     yield Button("Cancel", variant="error", id="cancel-btn")
                     yield Button(self.button_text, variant="primary", id="save-btn")
     
     def on_mount(self) -> None:
         """Focus the name input when dialog is mounted."""
-        self.query_one("#repo-name", Input).focus()
+        self._name_input.focus()
+    
+    def on_unmount(self) -> None:
+        """Forget cached path resolutions; the filesystem may change before the next dialog."""
+        resolve_path.cache_clear()
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-validate once typing pauses rather than on every key."""
+        if self._validation_timer is not None:
+            self._validation_timer.stop()
+        self._validation_timer = self.set_timer(self.validation_delay, self._do_validation)
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def _do_validation(self) -> None:
+        """Show a hint for the current input; the only live check that touches the filesystem."""
+        self._validation_timer = None
+        name = self._name_input.value.strip()
+        path_str = self._path_input.value.strip()
+        
+        message = ""
+        if name and not is_valid_repo_name(name):
+            message = "Invalid repository name"
+        elif path_str:
+            try:
+                path = await aresolve_path(path_str)
+            except FileNotFoundError:
+                path = None
+            # Still the text that was checked?
+            if path_str != self._path_input.value.strip():
+                return
+            if path is None:
+                message = "Path does not exist"
+        self._error_label.update(message)
+    
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses in the dialog."""
         if event.button.id == "save-btn":
-            self.save_repository()
+            await self.save_repository()
         else:
             self.dismiss(None)
     
-    def on_input_submitted(self, event: Input.Submitted) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in input fields."""
         if event.input.id == "repo-path":
-            self.save_repository()
+            await self.save_repository()
         else:
             # Move focus to path input
-            self.query_one("#repo-path", Input).focus()
+            self._path_input.focus()
     
-    def save_repository(self) -> None:
+    async def save_repository(self) -> None:
         """Validate and save the repository."""
-        name_input = self.query_one("#repo-name", Input)
-        path_input = self.query_one("#repo-path", Input)
-        
-        name = name_input.value.strip()
-        path_str = path_input.value.strip()
+        name = self._name_input.value.strip()
+        path_str = self._path_input.value.strip()
         
         if not name:
             self.notify("Repository name cannot be empty", severity="error")
@@ -98,9 +139,12 @@ class RepoDialog(ModalScreen[Union[Tuple[str, Path], Tuple[str, str, Path], None
             return
             
         try:
-            path = resolve_path(path_str)
-            if not path.exists():
-                self.notify(f"Path does not exist: {path}", severity="error")
+            try:
+                path = await aresolve_path(path_str)
+            except FileNotFoundError:
+                path = None
+            if path is None:
+                self.notify(f"Path does not exist: {path_str}", severity="error")
                 return
                 
             if not is_valid_repo_name(name):
@@ -1,5 +1,6 @@
 """Dialog for displaying git status."""
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from textual.app import ComposeResult
 from textual.containers import Container, ScrollableContainer, Vertical, Horizontal
@@ -83,7 +84,11 @@ class StatusDialog(ModalScreen[None]):
         super().__init__(*args, **kwargs)
         self.status_output = status_output
         self.repo_name = repo_name
-        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @cached_property
+    def timestamp(self) -> str:
+        """Time the dialog was first rendered."""
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the dialog."""
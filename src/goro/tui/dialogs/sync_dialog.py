@@ -1,19 +1,57 @@
 """Dialog for syncing all repositories."""
 import asyncio
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 from pathlib import Path
 
+from rich.style import Style
+from rich.text import Text
 from textual.app import ComposeResult
-from textual.containers import Container, ScrollableContainer
+from textual.color import Color, ColorParseError
+from textual.containers import Container, ScrollableContainer, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Static, Label
 from textual import work
 
+from goro.git import git_env
+
+# Theme variable that colours each kind of output line
+_LINE_COLORS = {
+    "command": "text-muted",
+    "command-output": "text",
+    "error": "error",
+    "success": "success",
+}
+
+def _theme_color(value: str, background: Color) -> Color:
+    """Blend a theme variable over `background` into a solid colour.
+
+    Handles the "auto N%" form used by $text and $text-muted, which
+    Color.parse() does not accept; anything unreadable falls back to the
+    background's contrast text colour.
+    """
+    if value.startswith("auto"):
+        _, _, alpha = value.partition(" ")
+        try:
+            opacity = float(alpha.rstrip("%")) / 100 if alpha else 1.0
+        except ValueError:
+            opacity = 1.0
+        return background + background.get_contrast_text(opacity)
+    try:
+        return background + Color.parse(value)
+    except ColorParseError:
+        return background.get_contrast_text()
+
 class SyncDialog(ModalScreen[None]):
     """A dialog showing sync progress for all repositories."""
 
     BINDINGS = [("escape", "dismiss")]
     
+    # Maximum number of repositories synced at the same time
+    max_concurrent = 4
+    
+    # Seconds between redraws of buffered output
+    flush_interval = 0.05
+    
     DEFAULT_CSS = """
     SyncDialog {
         align: center middle;
@@ -66,22 +104,12 @@ class SyncDialog(ModalScreen[None]):
         opacity: 1;
     }
     
-    .command {
-        color: $text-muted;
-        margin: 0 0 0 0;  /* top right bottom left - using integers only */
-    }
-    
-    .command-output {
-        margin: 0 0 0 2;
-        color: $text;
-    }
-    
-    .error {
-        color: $error;
+    .repo-output {
+        height: auto;
     }
     
-    .success {
-        color: $success;
+    .repo-log {
+        height: auto;
     }
     
     .repo-header {
@@ -93,16 +121,24 @@ class SyncDialog(ModalScreen[None]):
     }
     """
 
-    def __init__(self, config: Dict, *args, **kwargs) -> None:
+    def __init__(self, config: Dict, *args, timeout: float = 30.0, **kwargs) -> None:
         """Initialize the sync dialog.
         
         Args:
             config: The application configuration containing repository paths.
+            timeout: Seconds a single git command may run before it is killed.
         """
         super().__init__(*args, **kwargs)
         self.config = config
+        self.timeout = timeout
         self.results: List[Tuple[str, str, bool]] = []  # (repo_name, output, success)
         self.close_button: Optional[Button] = None
+        # Output is buffered per repository and redrawn on a timer
+        self._logs: Dict[str, Static] = {}
+        self._lines: Dict[str, List[Text]] = {}
+        self._pending: Set[str] = set()
+        # Rich styles resolved from the app's theme when the dialog mounts
+        self._line_styles: Dict[str, Style] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the dialog."""
@@ -117,14 +153,46 @@ class SyncDialog(ModalScreen[None]):
 
     def on_mount(self) -> None:
         """Start the sync process when the dialog is mounted."""
+        self._line_styles = self._theme_styles()
+        self.set_interval(self.flush_interval, self.flush_output)
         self.start_sync()
 
+    def _theme_styles(self) -> Dict[str, Style]:
+        """Resolve each kind of output line to a Rich style from the app's theme."""
+        variables = self.app.get_css_variables()
+        background = Color.parse(variables["panel"])
+        return {
+            class_name: Style(color=_theme_color(variables.get(name, ""), background).rich_color)
+            for class_name, name in _LINE_COLORS.items()
+        }
+
     @work(exclusive=True)
     async def start_sync(self) -> None:
-        """Run git sync commands for all repositories."""
-        for repo_name, repo_data in self.config.repos.items():
-            repo_path = Path(repo_data.path)
-            await self.run_sync_commands(repo_name, repo_path)
+        """Run git sync commands for all repositories concurrently."""
+        output = self.query_one(".sync-output", ScrollableContainer)
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        # One group per repository keeps its lines together while syncs interleave
+        groups = []
+        for repo_name in self.config.repos:
+            self._logs[repo_name] = Static(classes="repo-log")
+            self._lines[repo_name] = []
+            groups.append(Vertical(
+                Static(repo_name, classes="repo-header"),
+                self._logs[repo_name],
+                classes="repo-output",
+            ))
+        await output.mount_all(groups)
+        
+        async def sync_one(repo_name: str, repo_path: Path) -> None:
+            async with semaphore:
+                await self.run_sync_commands(repo_name, repo_path)
+        
+        await asyncio.gather(*(
+            sync_one(repo_name, repo_data.path_obj)
+            for repo_name, repo_data in self.config.repos.items()
+        ))
+        self.flush_output()
         
         # Enable close button after all repos are synced
         if self.close_button:
@@ -138,72 +206,114 @@ class SyncDialog(ModalScreen[None]):
             repo_name: Name of the repository
             repo_path: Path to the repository
         """
-        # Display repository name prominently
-        await self.append_output(f"{repo_name}", "repo-header")
-        
         commands = [
-            ("git add .", "Adding changes"),
-            ('git commit -m "goro Sync: Auto-commit by GORO" --allow-empty-message', "Committing changes"),
-            ("git pull", "Pulling latest changes"),
-            ("git push", "Pushing changes")
+            (["git", "add", "."], "Adding changes"),
+            (["git", "commit", "-m", "goro Sync: Auto-commit by GORO", "--allow-empty-message"], "Committing changes"),
+            (["git", "pull"], "Pulling latest changes"),
+            (["git", "push"], "Pushing changes")
         ]
         
-        for cmd, description in commands:
-            success, output = await self.run_command(cmd, repo_path)
+        for argv, description in commands:
+            success, output = await self.run_command(argv, repo_path, repo_name)
             self.results.append((repo_name, f"{description}: {output}", success))
             
             if not success:
                 break  # Stop if any command fails
 
-    async def run_command(self, command: str, cwd: Path) -> Tuple[bool, str]:
-        """Run a shell command and return its output.
+    async def run_command(self, argv: List[str], cwd: Path, repo_name: str) -> Tuple[bool, str]:
+        """Run a command without a shell and return its output.
         
         Args:
-            command: The command to run
+            argv: The command and its arguments
             cwd: Working directory for the command
+            repo_name: Repository whose output the lines are added to
             
         Returns:
             Tuple of (success, output)
         """
         # Update UI with the command being run
-        await self.append_output(f"$ {command}", "command")
+        await self.append_output(f"$ {' '.join(argv)}", "command", repo_name)
         
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                *argv,
                 cwd=cwd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
-                shell=True
+                env=git_env()
             )
             
-            # Read output in real-time
-            output = []
-            while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
-                line = line.decode().strip()
-                output.append(line)
-                await self.append_output(line, "command-output")
-            
-            # Wait for process to complete
-            await process.wait()
+            try:
+                output = await asyncio.wait_for(
+                    self.read_output(process, repo_name), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                # A hung command (e.g. an unreachable remote) must not block the dialog
+                process.kill()
+                await process.wait()
+                error_msg = f"Timed out after {self.timeout:g}s"
+                await self.append_output(error_msg, "error", repo_name)
+                return False, error_msg
                 
             return True, output
             
         except Exception as e:
             error_msg = f"Error running command: {str(e)}"
-            await self.append_output(error_msg, "error")
+            await self.append_output(error_msg, "error", repo_name)
             return False, error_msg
 
-    async def append_output(self, text: str, class_name: str = "") -> None:
-        """Append text to the output container."""
-        output = self.query_one(".sync-output", ScrollableContainer)
-        output.mount(Static(text, classes=class_name))
-        output.scroll_end(animate=False)
-        # Force a refresh to show the output immediately
-        self.refresh()
+    async def read_output(self, process: asyncio.subprocess.Process, repo_name: str) -> List[str]:
+        """Stream a process's output into the log until it exits.
+        
+        Args:
+            process: The running process, with stdout piped
+            repo_name: Repository whose output the lines are added to
+            
+        Returns:
+            List of output lines
+        """
+        # Started with stdout=PIPE, so the stream is always there
+        assert process.stdout is not None
+        # Read output in chunks and hand over complete lines in batches
+        output: List[str] = []
+        pending = b""
+        while True:
+            chunk = await process.stdout.read(4096)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                decoded = [line.decode(errors="replace").strip() for line in lines]
+                output.extend(decoded)
+                await self.append_output_many(decoded, "command-output", repo_name)
+        if pending:
+            line = pending.decode(errors="replace").strip()
+            output.append(line)
+            await self.append_output(line, "command-output", repo_name)
+        
+        # Wait for process to complete
+        await process.wait()
+        return output
+
+    async def append_output(self, text: str, class_name: str, repo_name: str) -> None:
+        """Buffer a line of a repository's output until the next flush."""
+        await self.append_output_many([text], class_name, repo_name)
+
+    async def append_output_many(self, lines: List[str], class_name: str, repo_name: str) -> None:
+        """Buffer several lines of a repository's output until the next flush."""
+        indent = "  " if class_name == "command-output" else ""
+        style = self._line_styles.get(class_name, "")
+        self._lines[repo_name].extend(Text(indent + line, style=style) for line in lines)
+        self._pending.add(repo_name)
+
+    def flush_output(self) -> None:
+        """Redraw the output of repositories that received new lines."""
+        if not self._pending:
+            return
+        for repo_name in self._pending:
+            self._logs[repo_name].update(Text("\n").join(self._lines[repo_name]))
+        self._pending.clear()
+        self.query_one(".sync-output", ScrollableContainer).scroll_end(animate=False)
 
     def action_dismiss(self) -> None:
         """Dismiss the dialog."""
@@ -1,8 +1,14 @@
 """Utility functions for the TUI."""
+import asyncio
 import re
-import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Disallowed characters that could cause issues: \ / : * ? " < > |
+_DISALLOWED = re.compile(r'[\\/:*?"<>|]')
 
 def is_valid_repo_name(name: str) -> bool:
     """Check if a repository name is valid.
@@ -12,13 +18,11 @@ def is_valid_repo_name(name: str) -> bool:
     - Wildcards (* ?)
     - Quotes and other problematic characters
     """
-    # Disallowed characters that could cause issues
-    # \ / : * ? " < > |
-    if any(c in name for c in '\\/:*?"<>|'):
+    # Basic length check, before running the pattern at all
+    if not (0 < len(name) <= 100):
         return False
         
-    # Basic length check
-    if not (0 < len(name) <= 100):
+    if _DISALLOWED.search(name):
         return False
         
     # Must contain at least one non-whitespace character
@@ -27,17 +31,27 @@ def is_valid_repo_name(name: str) -> bool:
         
     return True
 
-def safe_id(name: str) -> str:
-    """Generate a unique widget ID from a repository name."""
-    # Create a unique ID using UUID
-    unique_id = str(uuid.uuid4())
-    # Also include a sanitized version of the name for debugging
-    safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', name)[:20]  # Limit length
-    return f'repo-{safe_name}-{unique_id}'
-
+@lru_cache(maxsize=256)
 def resolve_path(path: str) -> Optional[Path]:
-    """Resolve and validate a filesystem path."""
+    """Resolve and validate a filesystem path.
+
+    Results are cached for the session, so retrying a dialog with the same
+    input doesn't repeat the realpath() syscalls. The path must exist: a
+    missing one raises FileNotFoundError, which lru_cache does not store, so
+    a path created later resolves on the next try.
+    """
     try:
-        return Path(path).expanduser().resolve()
+        return Path(path).expanduser().resolve(strict=True)
+    except FileNotFoundError:
+        raise
     except (OSError, RuntimeError):
         return None
+
+async def run_in_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call in the default executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+async def aresolve_path(path: str) -> Optional[Path]:
+    """Resolve a path in a worker thread so slow filesystems don't block the UI."""
+    return await run_in_thread(resolve_path, path)
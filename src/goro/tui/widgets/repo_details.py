@@ -1,6 +1,9 @@
 """Repository details widget for the GORO TUI."""
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
+from rich.panel import Panel
+from rich.table import Table
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
@@ -9,17 +12,44 @@ from textual.widgets import Label, Static
 from goro.config import RepoConfig
 
 
+_PLACEHOLDER = "Select a repository to view details"
+
+
+@lru_cache(maxsize=64)
+def _build_panel(name: str, path: str, plugins: Tuple[str, ...]) -> Panel:
+    """Build the Rich panel for a repository; reused when it is shown again."""
+    table = Table(show_header=False, box=None, show_edge=False)
+    table.add_column("Property", style="cyan")
+    table.add_column("Value", style="white")
+
+    table.add_row("Name:", name)
+    table.add_row("Path:", path)
+    table.add_row("Plugins:", ", ".join(plugins) if plugins else "None")
+
+    return Panel(
+        table,
+        title=f"{name}",
+        border_style="blue",
+        expand=True
+    )
+
+
 class RepoDetails(Static):
     """Widget that displays details of the selected repository."""
 
     repo: Optional[RepoConfig] = reactive(None)
 
+    # Static that shows the details, looked up on the first update and reused
+    _view: Optional[Static] = None
+    # What is currently rendered; None is the "no selection" placeholder
+    _shown_key: Optional[Tuple[str, str, Tuple[str, ...]]] = None
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the repository details."""
         with Container(id="repo-details-container"):
             yield Label("Repository Details", classes="header")
             with Container(id="repo-details"):
-                yield Label("Select a repository to view details")
+                yield Static(_PLACEHOLDER, id="repo-details-static")
 
     def update_repo(self, repo: Optional[RepoConfig] = None) -> None:
         """Update the displayed repository details.
@@ -27,34 +57,14 @@ class RepoDetails(Static):
         Args:
             repo: The repository configuration to display, or None to show no selection
         """
+        key = None if repo is None else (repo.name, repo.path, tuple(repo.plugins))
         self.repo = repo
-        details = self.query_one("#repo-details", Container)
-        details.remove_children()
-
-        if repo is None:
-            details.mount(Label("Select a repository to view details"))
+        # Already showing this repository (or the empty placeholder)
+        if key == self._shown_key:
             return
-
-        # Create a Static widget with rich content
-        from rich.panel import Panel as RichPanel
-        from rich.table import Table as RichTable
-        
-        table = RichTable(show_header=False, box=None, show_edge=False)
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="white")
-
-        table.add_row("Name:", repo.name)
-        table.add_row("Path:", str(repo.path))
-        table.add_row("Plugins:", ", ".join(repo.plugins) if repo.plugins else "None")
-
-        panel = RichPanel(
-            table,
-            title=f"{repo.name}",
-            border_style="blue",
-            expand=True
-        )
+        self._shown_key = key
         
-        # Create a Static widget to display the rich content
-        static = Static()
-        static.update(panel)
-        details.mount(static)
+        if self._view is None:
+            self._view = self.query_one("#repo-details-static", Static)
+        # Update the one Static in place rather than remounting it
+        self._view.update(_PLACEHOLDER if key is None else _build_panel(*key))
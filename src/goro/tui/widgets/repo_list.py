@@ -1,94 +1,127 @@
 """Repository list widget for the GORO TUI."""
 from __future__ import annotations
-from typing import Dict, Optional, TYPE_CHECKING
+from bisect import bisect_left
+from typing import Dict, List, Optional
 
-if TYPE_CHECKING:
-    from textual.widgets import Label, ListItem, ListView
-    from textual.message import Message
-
-from textual.app import ComposeResult
+from rich.text import Text
 from textual.message import Message
 from textual.reactive import reactive
-from textual.widgets import Label, ListItem, ListView, Static
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
 
-from ..utils import safe_id
 
+class RepoList(OptionList):
+    """Widget that displays a list of repositories.
 
-class RepoList(ListView):
-    """Widget that displays a list of repositories."""
+    Built on OptionList, which renders only the rows in view, so a long
+    configuration doesn't mount one widget per repository. Each option's id
+    is the repository name.
+    """
 
-    repos = reactive(dict)
     selected_repo = reactive(str)
 
     def __init__(self, repos: Dict, **kwargs):
-        # Initialize with empty list - we'll populate it in on_mount
-        super().__init__(*[], **kwargs)
-        self._repos = dict(repos)  # Internal storage
-        self.selected_repo = next(iter(repos), "")
-        
+        super().__init__(**kwargs)
+        # Shared with the caller (normally Config.repos), not copied; the
+        # caller updates the mapping and then tells the list what changed,
+        # so the list itself never writes to it
+        self._repos = repos
+        self._order: List[str] = []  # Names in display (sorted) order
+        # Latest assignment to repos, applied on the next message loop pass
+        self._pending_repos: Optional[Dict] = None
+        self.selected_repo = next(iter(repos)) if repos else ""
+
     @property
     def repos(self) -> Dict:
-        return self._repos
-        
+        return self._pending_repos if self._pending_repos is not None else self._repos
+
     @repos.setter
     def repos(self, new_repos: Dict) -> None:
-        # Update the internal state
-        self._repos = dict(new_repos)
-        
+        # Assignments made in the same tick coalesce into one list update
+        if self._pending_repos is None:
+            self.call_later(self._flush_repos)
+        self._pending_repos = new_repos
+
+    def _flush_repos(self) -> None:
+        """Apply the most recent repos assignment to the list."""
+        new_repos, self._pending_repos = self._pending_repos, None
+        if new_repos is not None:
+            self._apply_repos(new_repos)
+
+    def _apply_repos(self, new_repos: Dict) -> None:
+        """Bring the options in line with `new_repos`."""
+        self._repos = new_repos
+        # Same membership: nothing to rebuild
+        if len(new_repos) == len(self._order) and all(
+            name in new_repos for name in self._order
+        ):
+            return
+
         # Store current selection if it still exists
         current_selection = self.selected_repo if self.selected_repo in self._repos else (
             next(iter(self._repos)) if self._repos else None
         )
-        
-        # Clear and repopulate the list
-        self.clear()
-        
-        # Add all repositories to the list view
-        for name in sorted(self._repos.keys()):
-            item = ListItem(Label(name), id=safe_id(name))
-            self.append(item)
-        
-        # Update selection if needed
-        if current_selection and current_selection in self._repos:
-            self.selected_repo = current_selection
-            # Find and select the item in the list by name
-            for i, item in enumerate(self.children):
-                if item.children and isinstance(item.children[0], Label):
-                    try:
-                        # Try to get text using render() method
-                        rendered = item.children[0].render()
-                        if hasattr(rendered, 'plain'):
-                            label_text = rendered.plain
-                        else:
-                            # Fallback to string representation
-                            label_text = str(rendered)
-                        
-                        if label_text == current_selection:
-                            self.index = i
-                            return
-                    except Exception:
-                        continue
-            # The selection will be handled by the ListView.Selected event
-
-    def on_list_view_selected(self, event: 'RepoList.Selected') -> None:
+
+        self._order = sorted(self._repos.keys())
+        self._rebuild(current_selection)
+
+    def _rebuild(self, selection: Optional[str]) -> None:
+        """Replace every option from `_order`; options are plain data, not widgets."""
+        with self.app.batch_update():
+            self.clear_options()
+            self.add_options(Option(Text(name), id=name) for name in self._order)
+            if selection:
+                self.select(selection)
+
+    def _contains(self, name: str) -> bool:
+        """Check whether a name is listed, by bisecting the sorted names."""
+        position = bisect_left(self._order, name)
+        return position < len(self._order) and self._order[position] == name
+
+    def add_repo(self, name: str) -> None:
+        """Show a repository the caller has already added to the mapping."""
+        if self._contains(name):
+            return
+
+        position = bisect_left(self._order, name)
+        self._order.insert(position, name)
+        if position == len(self._order) - 1:
+            self.add_option(Option(Text(name), id=name))
+        else:
+            # OptionList only appends; re-adding the options is cheap
+            self._rebuild(self.selected_repo or None)
+
+    def remove_repo(self, name: str) -> None:
+        """Stop showing a repository the caller has already removed."""
+        if not self._contains(name):
+            return
+
+        del self._order[bisect_left(self._order, name)]
+        self.remove_option(name)
+        if self.selected_repo == name:
+            self.selected_repo = self._order[0] if self._order else ""
+
+    def select(self, name: str) -> None:
+        """Highlight a repository by name, if it is in the list."""
+        if not self._contains(name):
+            return
+        self.selected_repo = name
+        self.highlighted = bisect_left(self._order, name)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle repository selection."""
-        if hasattr(event, 'repo_name') and event.repo_name in self._repos:
-            self.selected_repo = event.repo_name
+        event.stop()
+        repo_name = event.option.id
+        if repo_name is None:
+            return
+        if repo_name in self._repos:
+            self.selected_repo = repo_name
+            self.post_message(self.Selected(self, repo_name))
 
-    class Selected(ListView.Selected):
+    class Selected(Message):
         """Message sent when a repository is selected."""
 
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            # Get the repository name from the selected item
-            if hasattr(self, 'item') and hasattr(self.item, 'children'):
-                for child in self.item.children:
-                    if isinstance(child, Label):
-                        try:
-                            rendered = child.render()
-                            self.repo_name = rendered.plain if hasattr(rendered, 'plain') else str(rendered)
-                            break
-                        except Exception:
-                            continue
-            else:
-                self.repo_name = ''
+        def __init__(self, repo_list: RepoList, repo_name: str) -> None:
+            super().__init__()
+            self.repo_list = repo_list
+            self.repo_name = repo_name
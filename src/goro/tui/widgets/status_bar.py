@@ -1,45 +1,66 @@
 """Status bar widget for the GORO TUI."""
 import logging
-from datetime import datetime
-from typing import List, Deque
+import time
+from typing import List, Deque, Optional
 from collections import deque
 from rich.text import Text
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Static, RichLog
 from textual.containers import Container
 
+# Style for each log level; anything else is shown in white
+_LEVEL_COLORS = {
+    "info": "green",
+    "warning": "yellow",
+    "error": "red",
+    "debug": "blue",
+}
+
 class StatusBar(Container):
     """Status bar widget with logging support."""
 
     status = reactive("Ready")
     max_log_entries = 1000
+    # Seconds between writes of buffered log lines to the RichLog (~30 Hz)
+    flush_interval = 1 / 30
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.log_entries: Deque[str] = deque(maxlen=self.max_log_entries)
+        # Lines waiting for the next flush, and the timer that will flush them
+        self._pending: List[Text] = []
+        self._flush_timer: Optional[Timer] = None
+        # Formatted clock for the last second a line was logged in
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
         self.rich_log = RichLog(highlight=True, markup=True, wrap=True)
         self.rich_log.styles.height = "100%"
         self.rich_log.styles.border = ("round", "gray")
-
-    def compose(self):
-        yield self.rich_log
-
-    def on_mount(self) -> None:
-        """Set up logging when the widget is mounted."""
-        # Add a custom handler to capture logs
+        # One handler per status bar, attached only while it is mounted
         self.handler = LogHandler(self)
         formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
         )
         self.handler.setFormatter(formatter)
-        logging.basicConfig(
-            level=logging.INFO,
-            handlers=[self.handler],
-            force=True
-        )
+
+    def compose(self):
+        yield self.rich_log
+
+    def on_mount(self) -> None:
+        """Set up logging when the widget is mounted."""
+        # Add to the root logger rather than replacing its handlers
+        root = logging.getLogger()
+        root.addHandler(self.handler)
+        if root.getEffectiveLevel() > logging.INFO:
+            root.setLevel(logging.INFO)
         logging.info("Application started")
 
+    def on_unmount(self) -> None:
+        """Detach the handler so a removed status bar stops receiving records."""
+        logging.getLogger().removeHandler(self.handler)
+
     def watch_status(self, status: str) -> None:
         """Update the status message and log it."""
         self.log(f"Status: {status}")
@@ -51,20 +72,34 @@ class StatusBar(Container):
             message: The message to log
             level: The log level (info, warning, error, debug)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level_color = {
-            "info": "green",
-            "warning": "yellow",
-            "error": "red",
-            "debug": "blue"
-        }.get(level.lower(), "white")
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        timestamp = self._last_ts_str
+        level_color = _LEVEL_COLORS.get(level.lower(), "white")
         
         log_text = Text()
         log_text.append(f"[{timestamp}] ", style=f"dim {level_color}")
         log_text.append(f"{message}", style=level_color)
         
-        self.rich_log.write(log_text)
-        self.rich_log.scroll_end(animate=False)
+        # Bursts of lines reach the RichLog as one write per tick
+        self._pending.append(log_text)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(self.flush_interval, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write the buffered log lines to the RichLog in one go."""
+        self._flush_timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            self.rich_log.write(Text("\n").join(pending))
+            self.rich_log.scroll_end(animate=False)
+
+    def clear(self) -> None:
+        """Remove every log line, including ones still waiting to be written."""
+        self._pending.clear()
+        self.rich_log.clear()
 
 
 class LogHandler(logging.Handler):
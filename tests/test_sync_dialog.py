@@ -0,0 +1,41 @@
+"""Pilot tests for the sync dialog."""
+import asyncio
+from pathlib import Path
+
+from textual.app import App
+
+from goro.config import Config, RepoConfig
+from goro.tui.dialogs.sync_dialog import SyncDialog
+
+
+class _DialogHost(App):
+    """Bare app that opens a SyncDialog as soon as it starts."""
+
+    def __init__(self, config: Config) -> None:
+        super().__init__()
+        self.sync_config = config
+
+    def on_mount(self) -> None:
+        self.push_screen(SyncDialog(self.sync_config, timeout=5.0))
+
+
+def test_sync_dialog_opens_with_default_theme(tmp_path: Path) -> None:
+    """The dialog mounts, resolves its theme colours and finishes syncing."""
+    # Not a git repository, so every git command fails fast
+    config = Config(repos={"plain": RepoConfig("plain", tmp_path)})
+
+    async def run() -> None:
+        app = _DialogHost(config)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            dialog = app.screen
+            assert isinstance(dialog, SyncDialog)
+            for _ in range(100):
+                if dialog.close_button is not None and not dialog.close_button.disabled:
+                    break
+                await pilot.pause(0.05)
+            assert dialog.close_button is not None
+            assert not dialog.close_button.disabled
+            assert dialog.results
+
+    asyncio.run(run())